@@ -175,14 +175,17 @@ class Scope(vm.VirtualMachine):
         analog_enable = sum(1 << (ord(channel)-ord('A')) for channel in analog_channels)
         logic_enable = sum(1 << channel for channel in logic_channels)
 
+        nanalog_channels = len(analog_channels)
+        period_ticks = period / self.primary_clock_period
+        sample_ticks = period_ticks / nsamples
         for capture_mode in vm.CaptureModes:
-            ticks = int(round(period / self.primary_clock_period / nsamples))
-            clock_scale = 1
-            if capture_mode.analog_channels == len(analog_channels) and capture_mode.logic_channels == bool(logic_channels):
+            if capture_mode.analog_channels == nanalog_channels and capture_mode.logic_channels == bool(logic_channels):
                 Log.debug(f"Considering trace mode {capture_mode.trace_mode.name}...")
+                ticks = int(round(sample_ticks))
+                clock_scale = 1
                 if ticks > capture_mode.clock_high and capture_mode.clock_divide > 1:
-                    clock_scale = min(capture_mode.clock_divide, int(math.ceil(period / self.primary_clock_period / nsamples / capture_mode.clock_high)))
-                    ticks = int(round(period / self.primary_clock_period / nsamples / clock_scale))
+                    clock_scale = min(capture_mode.clock_divide, int(math.ceil(sample_ticks / capture_mode.clock_high)))
+                    ticks = int(round(sample_ticks / clock_scale))
                     if ticks > capture_mode.clock_low:
                         if ticks > capture_mode.clock_high:
                             ticks = capture_mode.clock_high
@@ -196,8 +199,8 @@ class Scope(vm.VirtualMachine):
                 else:
                     Log.debug("- mode too slow")
                     continue
-                actual_nsamples = int(round(period / self.primary_clock_period / ticks / clock_scale))
-                if len(analog_channels) == 2:
+                actual_nsamples = int(round(period_ticks / ticks / clock_scale))
+                if nanalog_channels == 2:
                     actual_nsamples -= actual_nsamples % 2
                 buffer_width = self.capture_buffer_size // capture_mode.sample_width
                 if logic_channels and analog_channels:
@@ -304,7 +307,8 @@ class Scope(vm.VirtualMachine):
             await self.issue_triggered_trace()
         while True:
             try:
-                code, timestamp = (int(x, 16) for x in await self.read_replies(2))
+                code, timestamp = await self.read_replies(2)
+                code, timestamp = int(code, 16), int(timestamp, 16)
                 if code != vm.TraceStatus.Wait:
                     break
             except asyncio.CancelledError:
@@ -321,8 +325,10 @@ class Scope(vm.VirtualMachine):
         traces = DotDict()
 
         timestamps = array.array('d', (i * sample_period for i in range(nsamples)))
+        # Dumps must be run one after another: the device echoes each command before streaming the sample
+        # data, so a second dump issued early would interleave its echo with the first channel's samples
         for dump_channel, channel in enumerate(sorted(analog_channels)):
-            asamples = nsamples // len(analog_channels)
+            asamples = nsamples // nanalog_channels
             async with self.transaction():
                 await self.set_registers(SampleAddress=(address - nsamples) % buffer_width,
                                          DumpMode=vm.DumpMode.Native if capture_mode.sample_width == 2 else vm.DumpMode.Raw,
@@ -330,16 +336,16 @@ class Scope(vm.VirtualMachine):
                 await self.issue_program_spock_registers()
                 await self.issue_analog_dump_binary()
             value_multiplier, value_offset = (1, 0) if raw else (high-low, low-analog_params.ab_offset/2*(1 if channel == 'A' else -1))
-            data = await self.read_analog_samples(asamples, capture_mode.sample_width)
+            samples = await self.read_analog_samples(asamples, capture_mode.sample_width, value_multiplier, value_offset)
             series = DotDict({'channel': channel,
                               'capture_start': start_timestamp * self.primary_clock_period,
-                              'timestamps': timestamps[dump_channel::len(analog_channels)] if len(analog_channels) > 1 else timestamps,
-                              'samples': array.array('f', (value*value_multiplier+value_offset for value in data)),
-                              'sample_period': sample_period*len(analog_channels),
-                              'sample_rate': sample_rate/len(analog_channels),
+                              'timestamps': timestamps[dump_channel::nanalog_channels] if nanalog_channels > 1 else timestamps,
+                              'samples': samples,
+                              'sample_period': sample_period*nanalog_channels,
+                              'sample_rate': sample_rate/nanalog_channels,
                               'cause': cause})
             if cause == 'trigger' and channel == trigger:
-                series.trigger_timestamp = series.timestamps[trigger_samples // len(analog_channels)]
+                series.trigger_timestamp = series.timestamps[trigger_samples // nanalog_channels]
                 series.trigger_level = trigger_level
                 series.trigger_type = trigger_type
             traces[channel] = series
@@ -380,16 +386,20 @@ class Scope(vm.VirtualMachine):
         max_clock = min(vm.Registers.Clock.maximum_value, int(math.floor(self.primary_clock_rate / frequency / min_samples)))
         min_clock = max(self.awg_minimum_clock, int(math.ceil(self.primary_clock_rate / frequency / self.awg_sample_buffer_size)))
         best_solution = None
+        best_error = max_error
+        ticks_per_wave = self.primary_clock_rate / frequency
+        buffer_size = self.awg_sample_buffer_size
         for clock in range(min_clock, max_clock+1):
-            width = self.primary_clock_rate / frequency / clock
-            nwaves = int(self.awg_sample_buffer_size / width)
+            width = ticks_per_wave / clock
+            nwaves = int(buffer_size / width)
             size = int(round(nwaves * width))
             actualf = self.primary_clock_rate * nwaves / size / clock
             if actualf == frequency:
                 Log.debug(f"Exact solution: size={size} nwaves={nwaves} clock={clock}")
                 break
             error = abs(frequency - actualf) / frequency
-            if error < max_error and (best_solution is None or error < best_solution[0]):  # noqa
+            if error < best_error:
+                best_error = error
                 best_solution = error, size, nwaves, clock, actualf
         else:
             if best_solution is None:
@@ -436,6 +446,12 @@ class Scope(vm.VirtualMachine):
         Log.info("Signal generator stopped")
         self._awg_running = False
 
+    async def read_wavetable(self):
+        async with self.transaction():
+            await self.set_registers(Address=0, Size=self.awg_wavetable_size)
+            await self.issue_wavetable_read()
+        return await self.wavetable_read_bytes(self.awg_wavetable_size)
+
     async def start_clock(self, frequency, ratio=0.5, max_error=1e-4):
         if self._awg_running:
             raise UsageError("Cannot start clock while waveform generator in use")
@@ -486,16 +502,19 @@ class Scope(vm.VirtualMachine):
         """
         import numpy as np
         from scipy.optimize import minimize
-        items = []
+        items = np.empty((n*n, 5))
+        nitems = 0
 
         async def measure(lo, hi, period=2e-3, chop=True):
             if chop:
                 traces = await self.capture(channels=['A', 'B'], period=period, nsamples=2000, timeout=0, low=lo, high=hi, raw=True)
-                A = np.array(traces.A.samples)
-                B = np.array(traces.B.samples)
+                A = np.frombuffer(traces.A.samples, dtype=np.float32)
+                B = np.frombuffer(traces.B.samples, dtype=np.float32)
             else:
-                A = np.array((await self.capture(channels=['A'], period=period/2, nsamples=1000, timeout=0, low=lo, high=hi, raw=True)).A.samples)
-                B = np.array((await self.capture(channels=['B'], period=period/2, nsamples=1000, timeout=0, low=lo, high=hi, raw=True)).B.samples)
+                A = np.frombuffer((await self.capture(channels=['A'], period=period/2, nsamples=1000, timeout=0, low=lo, high=hi, raw=True)).A.samples,
+                                  dtype=np.float32)
+                B = np.frombuffer((await self.capture(channels=['B'], period=period/2, nsamples=1000, timeout=0, low=lo, high=hi, raw=True)).B.samples,
+                                  dtype=np.float32)
             Amean = A.mean()
             Azero, Afull = np.median(A[A <= Amean]), np.median(A[A >= Amean])
             Bmean = B.mean()
@@ -511,12 +530,13 @@ class Scope(vm.VirtualMachine):
         Log.info(f"Analog full range = {analog_scale:.2f}V, zero offset = {analog_offset:.2f}V")
         for lo in np.linspace(self.analog_lo_min, 0.5, n, endpoint=False):
             for hi in np.linspace(self.analog_hi_max, 0.5, n):
-                zero, full, offset = await measure(lo, hi, 2e-3 if len(items) % 4 < 2 else 1e-3, len(items) % 2 == 0)
+                zero, full, offset = await measure(lo, hi, 2e-3 if nitems % 4 < 2 else 1e-3, nitems % 2 == 0)
                 if 0.01 < zero < full < 0.99:
                     analog_range = self.clock_voltage / (full - zero)
-                    items.append((lo, hi, -zero*analog_range, (1-zero)*analog_range, offset*analog_range))
+                    items[nitems] = lo, hi, -zero*analog_range, (1-zero)*analog_range, offset*analog_range
+                    nitems += 1
         await self.stop_clock()
-        lo, hi, low, high, offset = np.array(items).T  # noqa
+        lo, hi, low, high, offset = items[:nitems].T  # noqa
 
         def f(params):
             dl, dh = self.calculate_lo_hi(low, high, self.AnalogParams(*params, analog_scale, analog_offset, None, None, None))
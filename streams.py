@@ -12,6 +12,7 @@ UDP : added by Luc MASSON
 
 import asyncio
 import asyncio.transports as transports
+from collections import deque
 import logging
 import sys
 import threading
@@ -21,6 +22,7 @@ from serial.tools.list_ports import comports
 
 
 Log = logging.getLogger(__name__)
+MaxWriteSize = 4096
 
 
 class SerialStream:
@@ -44,15 +46,23 @@ class SerialStream:
             serial.Serial(self._device, timeout=0, write_timeout=0, **kwargs)
         Log.debug(f"Opened SerialStream on {device}")
         self._loop = loop if loop is not None else asyncio.get_event_loop()
-        self._output_buffer = bytes()
+        self._output_buffer = bytearray()
         self._output_buffer_empty = None
         self._output_buffer_lock = threading.Lock() if self._use_threads else None
+        self._input_chunks = deque()
+        self._input_size = 0
+        self._input_ready = asyncio.Event()
+        self._input_exception = None
+        if not self._use_threads:
+            self._loop.add_reader(self._connection, self._read_available)
 
     def __repr__(self):
         return f'<{self.__class__.__name__}:{self._device}>'
 
     def close(self):
         if self._connection is not None:
+            if not self._use_threads and self._input_exception is None:
+                self._loop.remove_reader(self._connection)
             self._connection.close()
             self._connection = None
 
@@ -73,7 +83,7 @@ class SerialStream:
                 raise
             if nbytes:
                 Log.debug(f"Write {data[:nbytes]!r}")
-            self._output_buffer = data[nbytes:]
+            self._output_buffer += memoryview(data)[nbytes:]
         else:
             self._output_buffer += data
         if self._output_buffer and self._output_buffer_empty is None:
@@ -85,50 +95,88 @@ class SerialStream:
             await self._output_buffer_empty
 
     def _feed_data(self):
+        data = self._take_output_chunk()
         try:
-            nbytes = self._connection.write(self._output_buffer)
+            nbytes = self._connection.write(data)
         except serial.SerialTimeoutException:
             nbytes = 0
         except Exception as exc:
             Log.exception("Error writing to stream")
-            self._output_buffer_empty.set_exception(exc)
             self._loop.remove_writer(self._connection)
+            self._output_buffer.clear()
+            self._output_buffer_empty.set_exception(exc)
+            self._output_buffer_empty = None
+            return
         if nbytes:
-            Log.debug(f"Write {self._output_buffer[:nbytes]!r}")
-            self._output_buffer = self._output_buffer[nbytes:]
+            Log.debug(f"Write {data[:nbytes]!r}")
+            del self._output_buffer[:nbytes]
         if not self._output_buffer:
             self._loop.remove_writer(self._connection)
             self._output_buffer_empty.set_result(None)
             self._output_buffer_empty = None
 
+    def _take_output_chunk(self):
+        with memoryview(self._output_buffer) as view:
+            return view[:MaxWriteSize].tobytes()
+
     def _write_blocking(self):
         with self._output_buffer_lock:
-            while self._output_buffer:
-                data = bytes(self._output_buffer)
-                self._output_buffer_lock.release()
-                try:
-                    nbytes = self._connection.write(data)
-                finally:
-                    self._output_buffer_lock.acquire()
-                Log.debug(f"Write {self._output_buffer[:nbytes]!r}")
-                self._output_buffer = self._output_buffer[nbytes:]
-            self._output_buffer_empty = None
+            try:
+                while self._output_buffer:
+                    data = self._take_output_chunk()
+                    self._output_buffer_lock.release()
+                    try:
+                        nbytes = self._connection.write(data)
+                    finally:
+                        self._output_buffer_lock.acquire()
+                    Log.debug(f"Write {data[:nbytes]!r}")
+                    del self._output_buffer[:nbytes]
+            except Exception:
+                Log.exception("Error writing to stream")
+                self._output_buffer.clear()
+                raise
+            finally:
+                self._output_buffer_empty = None
 
     async def read(self, nbytes=None):
         if self._use_threads:
             return await self._loop.run_in_executor(None, self._read_blocking, nbytes)
-        while True:
-            nwaiting = self._connection.in_waiting
-            if nwaiting:
-                data = self._connection.read(nwaiting if nbytes is None else min(nbytes, nwaiting))
+        await self._wait_for_input()
+        if nbytes is None:
+            data = b''.join(self._input_chunks)
+            self._input_chunks.clear()
+            self._input_size = 0
+            return data
+        return self._take_input(nbytes)
+
+    def _read_available(self):
+        try:
+            data = self._connection.read(self._connection.in_waiting)
+        except Exception as exc:
+            Log.exception("Error reading from stream")
+            self._input_exception = exc
+            self._loop.remove_reader(self._connection)
+        else:
+            if data:
                 Log.debug(f"Read {data!r}")
-                return data
-            future = self._loop.create_future()
-            self._loop.add_reader(self._connection, future.set_result, None)
-            try:
-                await future
-            finally:
-                self._loop.remove_reader(self._connection)
+                self._input_chunks.append(data)
+                self._input_size += len(data)
+        self._input_ready.set()
+
+    def _take_input(self, nbytes):
+        chunk = self._input_chunks.popleft()
+        if nbytes < len(chunk):
+            self._input_chunks.appendleft(chunk[nbytes:])
+            chunk = chunk[:nbytes]
+        self._input_size -= len(chunk)
+        return chunk
+
+    async def _wait_for_input(self, nbytes=1):
+        while self._input_size < nbytes:
+            if self._input_exception is not None:
+                raise self._input_exception
+            self._input_ready.clear()
+            await self._input_ready.wait()
 
     def _read_blocking(self, nbytes=None):
         data = self._connection.read(1)
@@ -139,10 +187,19 @@ class SerialStream:
         return data
 
     async def readexactly(self, nbytes):
-        data = b''
-        while len(data) < nbytes:
-            data += await self.read(nbytes-len(data))
-        return data
+        chunks = []
+        if self._use_threads:
+            while nbytes:
+                chunk = await self.read(nbytes)
+                chunks.append(chunk)
+                nbytes -= len(chunk)
+        else:
+            await self._wait_for_input(nbytes)
+            while nbytes:
+                chunk = self._take_input(nbytes)
+                chunks.append(chunk)
+                nbytes -= len(chunk)
+        return chunks[0] if len(chunks) == 1 else b''.join(chunks)
 
 
 class UDPBitscope:
@@ -19,11 +19,14 @@ from collections import namedtuple
 from enum import IntEnum
 import logging
 import struct
+import sys
 
 from utils import DotDict
 
 
 Log = logging.getLogger(__name__)
+UnsignedWord = struct.Struct('<I')
+SignedWord = struct.Struct('<i')
 
 
 class Register(namedtuple('Register', ['base', 'dtype', 'description'])):
@@ -38,11 +41,11 @@ class Register(namedtuple('Register', ['base', 'dtype', 'description'])):
         if sign == 'U':
             max_value = (1 << width) - 1
             value = min(max(0, value), max_value)
-            data = struct.pack('<I', value)
+            data = UnsignedWord.pack(value)
         elif sign == 'S':
             max_value = (1 << (width - 1))
             value = min(max(-max_value, value), max_value - 1)
-            data = struct.pack('<i', value)
+            data = SignedWord.pack(value)
         else:
             raise TypeError("Unrecognised dtype")
         return data[:width//8]
@@ -52,9 +55,9 @@ class Register(namedtuple('Register', ['base', 'dtype', 'description'])):
             data = data + bytes(4 - len(data))
         sign = self.dtype[0]
         if sign == 'U':
-            value = struct.unpack('<I', data)[0]
+            value, = UnsignedWord.unpack(data)
         elif sign == 'S':
-            value = struct.unpack('<i', data)[0]
+            value, = SignedWord.unpack(data)
         else:
             raise TypeError("Unrecognised dtype")
         if '.' in self.dtype:
@@ -376,24 +379,7 @@ class VirtualMachine:
         Get serial number stocked in bitscope EEPROM
         read from (R17) register, one byte by one byte
         """
-        cmds = [
-            b'[11]@[30]sr',
-            b'[11]@[31]sr',
-            b'[11]@[32]sr',
-            b'[11]@[33]sr',
-            b'[11]@[34]sr',
-            b'[11]@[35]sr',
-            b'[11]@[36]sr',
-            b'[11]@[37]sr',
-        ]
-        serial_number = ""
-
-        for cmd in cmds:
-            await self.issue(cmd)
-            result = await self.read_replies(2)
-            serial_number += bytes([int(result[1], 16)]).decode("ascii")
-
-        return serial_number
+        return (await self.eeprom_read_bytes(0x30, 8)).decode('ascii')
 
     async def issue_program_spock_registers(self):
         await self.issue(b'>')
@@ -407,15 +393,19 @@ class VirtualMachine:
     async def issue_triggered_trace(self):
         await self.issue(b'D')
 
-    async def read_analog_samples(self, nsamples, sample_width):
+    async def read_analog_samples(self, nsamples, sample_width, scale=1, offset=0):
         if self._transactions:
             raise TypeError("Command transaction in progress")
         if sample_width == 2:
-            data = await self._reader.readexactly(2 * nsamples)
-            return array.array('f', ((value+32768)/65536 for (value,) in struct.iter_unpack('>h', data)))
+            samples = array.array('h', await self._reader.readexactly(2 * nsamples))
+            if sys.byteorder == 'little':
+                samples.byteswap()
+            scale, offset = scale/65536, scale/2 + offset
+            return array.array('f', [value*scale + offset for value in samples])
         if sample_width == 1:
-            data = await self._reader.readexactly(nsamples)
-            return array.array('f', (value/256 for value in data))
+            samples = array.array('B', await self._reader.readexactly(nsamples))
+            scale /= 256
+            return array.array('f', [value*scale + offset for value in samples])
         raise ValueError(f"Bad sample width: {sample_width}")
 
     async def read_logic_samples(self, nsamples):
@@ -465,3 +455,14 @@ class VirtualMachine:
 
     async def issue_write_eeprom(self):
         await self.issue(b'w')
+
+    async def eeprom_read_bytes(self, address, nbytes):
+        if self._transactions:
+            raise TypeError("Command transaction in progress")
+        data = bytearray()
+        for i in range(nbytes):
+            async with self.transaction():
+                await self.set_registers(EepromAddress=address+i)
+                await self.issue_read_eeprom()
+            data.append(int((await self.read_replies(2))[1], 16))
+        return bytes(data)